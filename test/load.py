@@ -39,6 +39,65 @@ except ImportError as e:
     calculate_possible_moves = has_possible_moves = make_move = get_username_by_id = update_scores = mock_function
 
 
+def piece_moves(board, row, col, client_number):
+    """Возвращает (путь, доска, game_status) для каждого хода шашки, продолжая цепочку взятий"""
+    return _piece_moves(board, row, col, client_number, False)
+
+
+def _piece_moves(board, row, col, client_number, only_captures):
+    results = []
+    for new_row, new_col in calculate_possible_moves(board, row, col, client_number):
+        # После взятия цепочка продолжается только следующим взятием
+        if only_captures and abs(new_row - row) != 2:
+            continue
+        new_board, can_continue, game_status = make_move(
+            [r[:] for r in board], new_row, new_col, (row, col), client_number
+        )
+        chain = _piece_moves(new_board, new_row, new_col, client_number, True) \
+            if can_continue and game_status == 0 else []
+        for path, chain_board, chain_status in chain:
+            results.append((((new_row, new_col),) + path, chain_board, chain_status))
+        if not chain:
+            results.append((((new_row, new_col),), new_board, game_status))
+    return results
+
+
+def side_moves(board, client_number):
+    """Возвращает (откуда, путь, доска, game_status) для всех ходов игрока.
+
+    Учитываются только простые шашки (код равен client_number): кодировка дамок
+    в тестах не зафиксирована, поэтому позиции с дамками не поддерживаются.
+    """
+    results = []
+    for row in range(8):
+        for col in range(8):
+            if board[row][col] == client_number:
+                for path, new_board, game_status in piece_moves(board, row, col, client_number):
+                    results.append(((row, col), path, new_board, game_status))
+    return results
+
+
+def _perft_child(new_board, game_status, client_number, depth):
+    # Ход, завершивший игру, считается листом дерева
+    if game_status != 0:
+        return 1
+    return perft(new_board, 3 - client_number, depth - 1)
+
+
+def perft(board, client_number, depth):
+    """Подсчитывает число листьев дерева ходов глубины depth из позиции board"""
+    if depth == 0:
+        return 1
+    return sum(_perft_child(new_board, game_status, client_number, depth)
+               for _, _, new_board, game_status in side_moves(board, client_number))
+
+
+def perft_divide(board, client_number, depth):
+    """Разбивка perft по первым ходам: {(откуда, путь): число узлов}"""
+    return {(origin, path): _perft_child(new_board, game_status, client_number, depth)
+            for origin, path, new_board, game_status in side_moves(board, client_number)}
+
+
 class TestLoadCapacity(unittest.TestCase):
     """Тесты на нагрузочную способность системы"""
 
@@ -248,6 +307,76 @@ class TestGameLogicLoad(unittest.TestCase):
         self.assertLess(duration, 15,
                         f"Симуляция должна выполняться быстрее 15 секунд (фактически: {duration:.2f})")
 
+    def test_perft_start_position(self):
+        """Тест подсчета узлов дерева ходов (perft) от начальной позиции"""
+        if calculate_possible_moves.__name__ == 'mock_function':
+            self.skipTest("Серверный модуль недоступен, perft не имеет смысла на заглушках")
+
+        # До второго полухода включительно взятий нет: красные ходят вниз, белые вверх
+        # (см. test_calculate_possible_moves), поэтому значения не зависят от правил взятия
+        expected_nodes = {1: 7, 2: 49}
+        expected_divide = {
+            ((2, 1), ((3, 0),)): 7, ((2, 1), ((3, 2),)): 7,
+            ((2, 3), ((3, 2),)): 7, ((2, 3), ((3, 4),)): 7,
+            ((2, 5), ((3, 4),)): 7, ((2, 5), ((3, 6),)): 7,
+            ((2, 7), ((3, 6),)): 7,
+        }
+
+        start_time = time.time()
+
+        for depth, expected in expected_nodes.items():
+            nodes = perft(self.test_board, 1, depth)
+            print(f"Perft({depth}): {nodes} узлов")
+            self.assertEqual(nodes, expected, f"Perft({depth}) от начальной позиции должен быть равен {expected}")
+
+        divide = perft_divide(self.test_board, 1, 2)
+        print(f"Divide(2): {divide}")
+        self.assertEqual(divide, expected_divide)
+
+        # Глубина 3 уже включает взятия, поэтому здесь измеряется только скорость
+        nodes = perft(self.test_board, 1, 3)
+
+        duration = time.time() - start_time
+        print(f"Perft(3): {nodes} узлов")
+        print(f"Время выполнения: {duration:.2f} секунд")
+        print(f"Скорость: {nodes / max(duration, 1e-9):.2f} узлов/сек")
+
+        self.assertGreater(nodes, 0)
+        self.assertLess(duration, 5,
+                        f"Perft должен выполняться быстрее 5 секунд (фактически: {duration:.2f})")
+
+    def test_perft_capture_chain(self):
+        """Тест продолжения цепочки взятий в perft при can_continue"""
+        module = sys.modules[__name__]
+
+        # Сценарий движка: (2, 1) бьет на (4, 3), затем с (4, 3) доступны
+        # взятие на (6, 5) и простой ход на (5, 2), который не должен продолжать цепочку
+        moves = {(2, 1): [(4, 3)], (4, 3): [(6, 5), (5, 2)]}
+
+        def fake_calculate_possible_moves(board, row, col, client_number):
+            return moves.get((row, col), []) if board[row][col] == client_number else []
+
+        def fake_make_move(board, row, col, selected_piece, client_number):
+            board[row][col] = board[selected_piece[0]][selected_piece[1]]
+            board[selected_piece[0]][selected_piece[1]] = 0
+            can_continue = (selected_piece, (row, col)) == ((2, 1), (4, 3))
+            game_status = client_number if (row, col) == (6, 5) else 0
+            return board, can_continue, game_status
+
+        board = [[0] * 8 for _ in range(8)]
+        board[2][1] = 1
+
+        with patch.object(module, 'calculate_possible_moves', fake_calculate_possible_moves), \
+                patch.object(module, 'make_move', fake_make_move):
+            divide = perft_divide(board, 1, 2)
+            nodes = perft(board, 1, 2)
+
+        print(f"Divide(2): {divide}")
+
+        # Единственный ход - полная цепочка, завершившая игру, поэтому это лист дерева
+        self.assertEqual(divide, {((2, 1), ((4, 3), (6, 5))): 1})
+        self.assertEqual(nodes, 1)
+
 
 class TestRoomManagementLoad(unittest.TestCase):
     """Тесты нагрузочного тестирования управления комнатами"""